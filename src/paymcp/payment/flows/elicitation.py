@@ -1,5 +1,6 @@
 
 # paymcp/payment/flows/elicitation.py
+import asyncio
 import functools
 from ...utils.messages import open_link_message, opened_webview_message
 from ..webview import open_payment_webview_if_available
@@ -15,15 +16,16 @@ def make_paid_wrapper(func, mcp, provider, price_info):
     @functools.wraps(func)
     async def wrapper(*args, **kwargs):
         ctx = kwargs.get("ctx", None)
-        logger.debug(f"[make_paid_wrapper] Starting tool: {func.__name__}")
+        logger.debug("[make_paid_wrapper] Starting tool: %s", func.__name__)
 
         # 1. Initiate payment
-        payment_id, payment_url = provider.create_payment(
+        payment_id, payment_url = await asyncio.to_thread(
+            provider.create_payment,
             amount=price_info["price"],
             currency=price_info["currency"],
             description=f"{func.__name__}() execution fee"
         )
-        logger.debug(f"[make_paid_wrapper] Created payment with ID: {payment_id}")
+        logger.debug("[make_paid_wrapper] Created payment with ID: %s", payment_id)
 
         if (open_payment_webview_if_available(payment_url)):
             message = opened_webview_message(
@@ -35,7 +37,7 @@ def make_paid_wrapper(func, mcp, provider, price_info):
             )
 
         # 2. Ask the user to confirm payment
-        logger.debug(f"[make_paid_wrapper] Calling elicitation {ctx}")
+        logger.debug("[make_paid_wrapper] Calling elicitation %s", ctx)
         
         try:
             payment_status = await run_elicitation_loop(ctx, func, message, provider, payment_id)
@@ -22,16 +22,19 @@ def make_paid_wrapper(
 
     @functools.wraps(func)
     async def _progress_wrapper(*args, **kwargs):
-        payment_id, payment_url = provider.create_payment(
+        payment_id, payment_url = await asyncio.to_thread(
+            provider.create_payment,
             amount=price_info["price"],
             currency=price_info["currency"],
             description=f"{func.__name__}() execution fee"
         )
         ctx = kwargs.get("ctx", None)
+        # Resolved once; _notify runs on every poll tick
+        report_progress = getattr(ctx, "report_progress", None)
         # Helper to emit progress safely
         async def _notify(message: str, progress: Optional[int] = None):
-            if ctx is not None and hasattr(ctx, "report_progress"):
-                await ctx.report_progress(
+            if report_progress is not None:
+                await report_progress(
                     message=message,
                     progress=progress or 0,
                     total=100,
@@ -58,7 +61,7 @@ def make_paid_wrapper(
             await asyncio.sleep(DEFAULT_POLL_SECONDS)
             waited += DEFAULT_POLL_SECONDS
 
-            status = provider.get_payment_status(payment_id)
+            status = await asyncio.to_thread(provider.get_payment_status, payment_id)
 
             if status == "paid":
                 await _notify("Payment received — generating result …", progress=100)
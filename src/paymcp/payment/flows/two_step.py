@@ -1,4 +1,5 @@
 # paymcp/payment/flows/two_step.py
+import asyncio
 import functools
 from typing import Dict, Any
 from ...utils.messages import open_link_message, opened_webview_message
@@ -28,20 +29,25 @@ def make_paid_wrapper(func, mcp, provider, price_info):
     )
     async def _confirm_tool(payment_id: str):
         logger.info(f"[confirm_tool] Received payment_id={payment_id}")
-        original_args = PENDING_ARGS.get(str(payment_id), None)
-        logger.debug(f"[confirm_tool] PENDING_ARGS keys: {list(PENDING_ARGS.keys())}")
-        logger.debug(f"[confirm_tool] Retrieved args: {original_args}")
+        logger.debug("[confirm_tool] PENDING_ARGS keys: %s", list(PENDING_ARGS.keys()))
+        # Claim the args before awaiting so concurrent confirms can't both reach the
+        # status check (PayPal's get_payment_status captures the order)
+        original_args = PENDING_ARGS.pop(str(payment_id), None)
+        logger.debug("[confirm_tool] Retrieved args: %s", original_args)
         if original_args is None:
             raise RuntimeError("Unknown or expired payment_id")
-        
-        status = provider.get_payment_status(payment_id)
+
+        try:
+            status = await asyncio.to_thread(provider.get_payment_status, payment_id)
+        except BaseException:  # includes cancellation, so the payment can still be confirmed later
+            PENDING_ARGS[str(payment_id)] = original_args
+            raise
         if status != "paid":
+            PENDING_ARGS[str(payment_id)] = original_args
             raise RuntimeError(
                 f"Payment status is {status}, expected 'paid'"
             )
-        logger.debug(f"[confirm_tool] Calling {func.__name__} with args: {original_args}")
-
-        del PENDING_ARGS[str(payment_id)]
+        logger.debug("[confirm_tool] Calling %s with args: %s", func.__name__, original_args)
 
         # Call the original tool with its initial arguments
         return await func(**original_args)
@@ -49,7 +55,8 @@ def make_paid_wrapper(func, mcp, provider, price_info):
     # --- Step 1: payment initiation -------------------------------------------
     @functools.wraps(func)
     async def _initiate_wrapper(*args, **kwargs):
-        payment_id, payment_url = provider.create_payment(
+        payment_id, payment_url = await asyncio.to_thread(
+            provider.create_payment,
             amount=price_info["price"],
             currency=price_info["currency"],
             description=f"{func.__name__}() execution fee"
@@ -1,10 +1,9 @@
 import logging
 logger = logging.getLogger(__name__)
 from importlib.util import find_spec
+from functools import lru_cache
 import threading
-import multiprocessing
 import sys
-import webbrowser
 
 def _open_payment_webview(url: str):
     """Open the payment URL in an embedded pywebview window, 
@@ -26,12 +25,19 @@ def _open_payment_webview(url: str):
         logger.exception("Failed to open payment webview")
 
 
+@lru_cache(maxsize=None)
+def _webview_installed() -> bool:
+    # The optional extra can't appear mid-process, so probe sys.path only once
+    return find_spec("webview") is not None
+
+
 def open_payment_webview_if_available(url: str) -> bool:
-    if find_spec("webview") is not None:
+    if _webview_installed():
         try:
             if sys.platform == "darwin":
                 # On macOS, run pywebview in a separate process so the GUI
                 # runs on that process's main thread (Cocoa requirement).
+                import multiprocessing  # only needed on this branch
                 ctx = multiprocessing.get_context("spawn")
                 p = ctx.Process(
                     target=_open_payment_webview,
@@ -52,6 +58,7 @@ def open_payment_webview_if_available(url: str) -> bool:
         except Exception:
             logger.exception("[initiate] Failed to launch pywebview; falling back to browser")
             try:
+                import webbrowser
                 webbrowser.open(url)
                 logger.info("[initiate] Opened default browser for payment url")
                 return True
@@ -1,6 +1,13 @@
 from .base import BasePaymentProvider
 import logging
 
+# Adyen payment link status -> paymcp status
+STATUS_MAP = {
+    "completed": "paid",
+    "active": "pending",
+    "expired": "failed",
+}
+
 
 class AdyenProvider(BasePaymentProvider):
     def __init__(
@@ -29,7 +36,7 @@ class AdyenProvider(BasePaymentProvider):
 
     def create_payment(self, amount: float, currency: str, description: str):
         """Creates Adyen Pay-by-Link and returns (link_id, payment_url)."""
-        self.logger.debug(f"Creating Adyen payment: {amount} {currency} for '{description}'")
+        self.logger.debug("Creating Adyen payment: %s %s for '%s'", amount, currency, description)
         data = {
             "amount": {
                 "currency": currency.upper(),
@@ -47,11 +54,4 @@ class AdyenProvider(BasePaymentProvider):
         self.logger.debug("Checking Adyen payment status for: %s", payment_id)
         payment = self._request("GET", f"{self.base_url}/paymentLinks/{payment_id}")
         status = payment.get("status")
-
-        if status == "completed":
-            return "paid"
-        elif status == "active":
-            return "pending"
-        elif status == "expired":
-            return "failed"
-        return status or "unknown"
\ No newline at end of file
+        return STATUS_MAP.get(status, status or "unknown")
\ No newline at end of file
@@ -1,6 +1,8 @@
 from abc import ABC, abstractmethod
 from typing import Tuple
+from http.cookiejar import DefaultCookiePolicy
 import logging
+import threading
 import requests
 
 class BasePaymentProvider(ABC):
@@ -9,6 +11,22 @@ class BasePaymentProvider(ABC):
     def __init__(self, api_key: str = None, apiKey: str = None, logger: logging.Logger = None):
         self.api_key = api_key if api_key is not None else apiKey
         self.logger = logger or logging.getLogger(self.__class__.__name__)
+        self._local = threading.local()
+
+    @property
+    def _session(self) -> requests.Session:
+        """Pooled session for the calling thread.
+
+        Flows call providers from asyncio.to_thread workers, and requests.Session
+        is not guaranteed thread-safe, so each worker thread keeps its own.
+        """
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = requests.Session()
+            # Stay stateless like plain requests.get/post: never store or replay cookies
+            session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+            self._local.session = session
+        return session
 
     def _build_headers(self) -> dict:
         return {
@@ -20,16 +38,16 @@ class BasePaymentProvider(ABC):
         headers = self._build_headers()
         try:
             if method.upper() == "GET":
-                resp = requests.get(url, headers=headers, params=data)
+                resp = self._session.get(url, headers=headers, params=data)
             elif method.upper() == "POST":
                 if headers.get("Content-Type") == "application/json":
-                    resp = requests.post(url, headers=headers, json=data)
+                    resp = self._session.post(url, headers=headers, json=data)
                 else:
-                    resp = requests.post(url, headers=headers, data=data)
+                    resp = self._session.post(url, headers=headers, data=data)
             else:
                 raise ValueError(f"Unsupported HTTP method: {method}")
             resp.raise_for_status()
-            self.logger.debug(f"HTTP {method} {url} succeeded with status {resp.status_code}")
+            self.logger.debug("HTTP %s %s succeeded with status %s", method, url, resp.status_code)
             return resp.json()
         except requests.exceptions.HTTPError as e:
             self.logger.error(f"HTTP error occurred: {e}")
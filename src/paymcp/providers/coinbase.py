@@ -34,7 +34,7 @@ class CoinbaseProvider(BasePaymentProvider):
 
     def create_payment(self, amount: float, currency: str, description: str):
         """Creates a Coinbase Commerce charge and returns (code, hosted_url)."""
-        self.logger.debug(f"Creating Coinbase charge: {amount} {currency} for '{description}'")
+        self.logger.debug("Creating Coinbase charge: %s %s for '%s'", amount, currency, description)
 
         fiat_currency = (currency or "USD").upper()
         if fiat_currency == "USDC":
@@ -1,7 +1,11 @@
-import requests
 from requests.auth import HTTPBasicAuth
 from .base import BasePaymentProvider
 import logging
+import threading
+import time
+
+# Refresh this many seconds before PayPal's stated expiry so in-flight calls never carry a stale token
+TOKEN_EXPIRY_MARGIN = 60
 
 class PayPalProvider(BasePaymentProvider):
     def __init__(self, 
@@ -16,25 +20,42 @@ class PayPalProvider(BasePaymentProvider):
         self.success_url = success_url
         self.cancel_url = cancel_url
         self.base_url = "https://api-m.sandbox.paypal.com" if sandbox else "https://api-m.paypal.com"
-        self._token = self._get_token()
         super().__init__(logger=logger)
+        self._token = None
+        self._token_expires_at = 0.0
+        self._token_lock = threading.Lock()
+        self._get_token()
         self.logger.debug("PayPal ready")
 
     def _get_token(self):
-        """Get OAuth token from PayPal."""
-        resp = requests.post(
-            f"{self.base_url}/v1/oauth2/token",
-            auth=HTTPBasicAuth(self.client_id, self.client_secret),
-            data={"grant_type": "client_credentials"}
-        )
-        resp.raise_for_status()
-        return resp.json()["access_token"]
+        """Get OAuth token from PayPal, reusing the cached one until it expires."""
+        # Provider calls run in worker threads; serialize refreshes so only one thread fetches
+        with self._token_lock:
+            if self._token and time.monotonic() < self._token_expires_at:
+                return self._token
+            resp = self._session.post(
+                f"{self.base_url}/v1/oauth2/token",
+                auth=HTTPBasicAuth(self.client_id, self.client_secret),
+                data={"grant_type": "client_credentials"}
+            )
+            resp.raise_for_status()
+            data = resp.json()
+            self._token = data["access_token"]
+            self._token_expires_at = time.monotonic() + data.get("expires_in", 0) - TOKEN_EXPIRY_MARGIN
+            return self._token
+
+    def _build_headers(self) -> dict:
+        """PayPal uses a Bearer OAuth token, refreshed when it expires."""
+        return {
+            "Authorization": f"Bearer {self._get_token()}",
+            "Content-Type": "application/json",
+        }
 
     def create_payment(self, amount: float, currency: str, description: str):
         """Creates a PayPal checkout and returns (order_id, approval_url)."""
-        self.logger.debug(f"Creating PayPal payment: {amount} {currency} for '{description}'")
+        self.logger.debug("Creating PayPal payment: %s %s for '%s'", amount, currency, description)
         
-        headers = {"Authorization": f"Bearer {self._token}"}
+        headers = self._build_headers()
         payload = {
             "intent": "CAPTURE",
             "purchase_units": [{
@@ -48,7 +69,7 @@ class PayPalProvider(BasePaymentProvider):
             }
         }
         
-        resp = requests.post(f"{self.base_url}/v2/checkout/orders", headers=headers, json=payload)
+        resp = self._session.post(f"{self.base_url}/v2/checkout/orders", headers=headers, json=payload)
         resp.raise_for_status()
         data = resp.json()
         
@@ -57,18 +78,18 @@ class PayPalProvider(BasePaymentProvider):
 
     def get_payment_status(self, payment_id: str) -> str:
         """Returns payment status, auto-capturing if approved."""
-        self.logger.debug(f"Checking PayPal payment status for: {payment_id}")
+        self.logger.debug("Checking PayPal payment status for: %s", payment_id)
         
-        headers = {"Authorization": f"Bearer {self._token}"}
-        resp = requests.get(f"{self.base_url}/v2/checkout/orders/{payment_id}", headers=headers)
+        headers = self._build_headers()
+        resp = self._session.get(f"{self.base_url}/v2/checkout/orders/{payment_id}", headers=headers)
         resp.raise_for_status()
         data = resp.json()
         
         # Auto-capture approved payments
         if data["status"] == "APPROVED":
             try:
-                self.logger.debug(f"Auto-capturing payment: {payment_id}")
-                capture_resp = requests.post(
+                self.logger.debug("Auto-capturing payment: %s", payment_id)
+                capture_resp = self._session.post(
                     f"{self.base_url}/v2/checkout/orders/{payment_id}/capture",
                     headers=headers,
                     json={}
@@ -1,4 +1,3 @@
-import requests
 from .base import BasePaymentProvider
 import logging
 import time
@@ -42,7 +41,7 @@ class SquareProvider(BasePaymentProvider):
 
     def create_payment(self, amount: float, currency: str, description: str):
         """Creates a Square Payment Link and returns (payment_id, payment_url)."""
-        self.logger.debug(f"Creating Square payment: {amount} {currency} for '{description}'")
+        self.logger.debug("Creating Square payment: %s %s for '%s'", amount, currency, description)
 
         # Convert to cents
         amount_cents = int(amount * 100)
@@ -62,7 +61,7 @@ class SquareProvider(BasePaymentProvider):
             }
         }
 
-        resp = requests.post(
+        resp = self._session.post(
             f"{self.base_url}/v2/online-checkout/payment-links",
             headers=self._build_headers(),
             json=payload
@@ -81,11 +80,11 @@ class SquareProvider(BasePaymentProvider):
 
     def get_payment_status(self, payment_id: str) -> str:
         """Returns payment status for the given payment link ID."""
-        self.logger.debug(f"Checking Square payment status for: {payment_id}")
+        self.logger.debug("Checking Square payment status for: %s", payment_id)
 
         try:
             # Get the payment link to find the order ID
-            resp = requests.get(
+            resp = self._session.get(
                 f"{self.base_url}/v2/online-checkout/payment-links/{payment_id}",
                 headers=self._build_headers()
             )
@@ -99,7 +98,7 @@ class SquareProvider(BasePaymentProvider):
                 return "pending"
 
             # Check the order status
-            order_resp = requests.get(
+            order_resp = self._session.get(
                 f"{self.base_url}/v2/orders/{order_id}?location_id={self.location_id}",
                 headers=self._build_headers()
             )
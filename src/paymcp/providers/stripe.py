@@ -19,7 +19,7 @@ class StripeProvider(BasePaymentProvider):
 
     def create_payment(self, amount: float, currency: str, description: str):
         """Creates a Stripe Checkout session and returns (session_id, session_url)."""
-        self.logger.debug(f"Creating Stripe payment: {amount} {currency} for '{description}'")
+        self.logger.debug("Creating Stripe payment: %s %s for '%s'", amount, currency, description)
         data = {
             "mode": "payment",
             "success_url": self.success_url,
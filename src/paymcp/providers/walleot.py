@@ -23,7 +23,7 @@ class WalleotProvider(BasePaymentProvider):
 
     def create_payment(self, amount: float, currency: str, description: str):
         """Creates a Walleot payment session and returns (session_id, session_url)."""
-        self.logger.debug(f"Creating Walleot payment session: {amount} {currency} for '{description}'")
+        self.logger.debug("Creating Walleot payment session: %s %s for '%s'", amount, currency, description)
         data = {
             "amount": int(amount * 100),
             "currency": currency.lower(),
@@ -1,3 +1,4 @@
+import asyncio
 import inspect
 from .responseSchema import SimpleActionSchema
 from types import SimpleNamespace
@@ -5,10 +6,17 @@ import logging
 logger = logging.getLogger(__name__)
 
 async def run_elicitation_loop(ctx, func, message, provider, payment_id, max_attempts=5):
+    # ctx.elicit's signature can't change between attempts, so inspect it once.
+    # If it can't be inspected, use schema=; a missing ctx.elicit then fails in the loop's handler.
+    try:
+        uses_response_type = "response_type" in inspect.signature(ctx.elicit).parameters
+    except (AttributeError, TypeError, ValueError):
+        uses_response_type = False
+
     for attempt in range(max_attempts):
         try:
-            if "response_type" in inspect.signature(ctx.elicit).parameters:
-                logger.debug(f"[run_elicitation_loop] Attempt {attempt+1},")
+            if uses_response_type:
+                logger.debug("[run_elicitation_loop] Attempt %s,", attempt+1)
                 elicitation = await ctx.elicit(
                     message=message,
                     response_type=None
@@ -33,14 +41,14 @@ async def run_elicitation_loop(ctx, func, message, provider, payment_id, max_att
             else:
                 raise RuntimeError("Elicitation failed during confirmation loop.") from e
 
-        logger.debug(f"[run_elicitation_loop] Elicitation response: {elicitation}")
+        logger.debug("[run_elicitation_loop] Elicitation response: %s", elicitation)
 
         if elicitation.action == "cancel" or elicitation.action == "decline":
             logger.debug("[run_elicitation_loop] User canceled payment")
             raise RuntimeError("Payment canceled by user")
 
-        status = provider.get_payment_status(payment_id)
-        logger.debug(f"[run_elicitation_loop]: payment status = {status}")
+        status = await asyncio.to_thread(provider.get_payment_status, payment_id)
+        logger.debug("[run_elicitation_loop]: payment status = %s", status)
         if status == "paid" or status == "canceled":
             return status 
     return "pending"
\ No newline at end of file